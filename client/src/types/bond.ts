@@ -21,6 +21,9 @@ export interface Bond {
   liquidityScore?: number;
   status?: string;
   updatedAt?: Date;
+  quotedAt?: Date;
+  quoteReceivedAt?: Date;
+  quoteAge?: number | null;
 }
 
 export interface MarketData {
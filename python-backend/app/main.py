@@ -4,17 +4,26 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import uvicorn
 import os
-from typing import Optional, List
+from typing import Optional, List, Literal
 from contextlib import asynccontextmanager
 
-from .models import Bond, Order, OrderRequest, OrderResponse, HistoricalPrices, OrderBook
+from .models import Bond, Order, OrderRequest, OrderResponse, HistoricalPrices, PriceBars, OrderBook
 from .services.moment_api import MomentAPIService
+from .services.price_bars import MAX_PRICE_BARS, MAX_PRICE_POINTS, estimate_bar_count
+from .services.quote_refresher import QuoteRefresher
 from .storage import BondStorage
 
 
 # Global storage instance
 bond_storage = BondStorage()
 moment_api = MomentAPIService()
+quote_refresher = QuoteRefresher(
+    moment_api,
+    bond_storage,
+    requests_per_second=float(os.getenv("QUOTE_REFRESH_RPS", "2")),
+    jitter=float(os.getenv("QUOTE_REFRESH_JITTER", "0.5")),
+    max_in_flight=int(os.getenv("QUOTE_REFRESH_MAX_IN_FLIGHT", "4"))
+)
 
 
 @asynccontextmanager
@@ -30,10 +39,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         pass
     
+    # Keep stored prices warm in the background
+    quote_refresher.start()
+    
     yield
     
     # Shutdown
-    pass
+    await quote_refresher.stop()
 
 app = FastAPI(
     title="Bond Screener API",
@@ -61,9 +73,14 @@ async def get_bonds(
     min_yield: Optional[float] = Query(None),
     max_yield: Optional[float] = Query(None),
     min_maturity: Optional[int] = Query(None),
-    max_maturity: Optional[int] = Query(None)
+    max_maturity: Optional[int] = Query(None),
+    min_price: Optional[float] = Query(None),
+    max_price: Optional[float] = Query(None),
+    max_quote_age: Optional[float] = Query(None, description="Only bonds quoted within this many seconds"),
+    sort_by: Optional[Literal["price", "yield", "maturity", "quote_age"]] = Query(None),
+    descending: bool = Query(False)
 ):
-    """Get filtered list of bonds"""
+    """Get filtered list of bonds, served from stored quotes"""
     filters = {
         'bond_type': bond_type,
         'rating': rating,
@@ -72,7 +89,12 @@ async def get_bonds(
         'min_yield': min_yield,
         'max_yield': max_yield,
         'min_maturity': min_maturity,
-        'max_maturity': max_maturity
+        'max_maturity': max_maturity,
+        'min_price': min_price,
+        'max_price': max_price,
+        'max_quote_age': max_quote_age,
+        'sort_by': sort_by,
+        'descending': descending
     }
     
     # Remove None values
@@ -86,13 +108,16 @@ async def get_bond(bond_id: str):
     bond = bond_storage.get_bond(bond_id)
     if not bond:
         raise HTTPException(status_code=404, detail="Bond not found")
+    bond_storage.record_interest(bond_id)
     return bond
 
 @app.get("/api/bonds/{bond_id}/quote")
 async def get_bond_quote(bond_id: str):
     """Get real-time quote for a bond"""
+    bond_storage.record_interest(bond_id)
     try:
         quote = await moment_api.get_quote(bond_id)
+        bond_storage.update_quote(bond_id, quote)
         return quote
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Quote not available: {str(e)}")
@@ -105,15 +130,53 @@ async def get_bond_historical_prices(
     frequency: str = Query("1day", description="Frequency: 1day, 15min, or 1min")
 ):
     """Get historical pricing data for a bond"""
+    try:
+        points = estimate_bar_count(start, end, frequency)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if points > MAX_PRICE_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range too large for {frequency} prices (up to {points} points, max {MAX_PRICE_POINTS}); use /prices/bars"
+        )
+    
+    bond_storage.record_interest(bond_id)
     try:
         prices = await moment_api.get_historical_prices(bond_id, start, end, frequency)
         return prices
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Historical prices not available: {str(e)}")
 
+@app.get("/api/bonds/{bond_id}/prices/bars", response_model=PriceBars)
+async def get_bond_price_bars(
+    bond_id: str,
+    start: str = Query(..., description="Start date (YYYY-MM-DD)"),
+    end: str = Query(..., description="End date (YYYY-MM-DD)"),
+    frequency: str = Query("1min", description="Source frequency: 1day, 15min, or 1min"),
+    resolution: str = Query("1h", description="Bar size, e.g. 15min, 1h, 1day")
+):
+    """Get historical prices downsampled to OHLC bars with min/max yield"""
+    try:
+        bar_count = estimate_bar_count(start, end, resolution)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if bar_count > MAX_PRICE_BARS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Resolution {resolution} too fine for this range (up to {bar_count} bars, max {MAX_PRICE_BARS})"
+        )
+    
+    bond_storage.record_interest(bond_id)
+    try:
+        bars = await moment_api.get_price_bars(bond_id, start, end, frequency, resolution)
+        return bars
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=f"Price bars not available: {str(e)}")
+
 @app.get("/api/bonds/{bond_id}/order-book", response_model=OrderBook)
 async def get_bond_order_book(bond_id: str):
     """Get full order book for a bond"""
+    bond_storage.record_interest(bond_id)
     try:
         order_book = await moment_api.get_order_book(bond_id)
         return order_book
@@ -123,6 +186,7 @@ async def get_bond_order_book(bond_id: str):
 @app.post("/api/orders", response_model=OrderResponse)
 async def submit_order(order_request: OrderRequest):
     """Submit a buy/sell order"""
+    bond_storage.record_interest(order_request.instrument_id)
     try:
         # Mock order submission (API key lacks trading permissions)
         order_response = await moment_api.submit_mock_order(order_request)
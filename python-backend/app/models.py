@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import Optional, Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 class OrderSide(str, Enum):
@@ -38,6 +38,8 @@ class Bond(BaseModel):
     liquidity_score: Optional[str] = Field(alias="liquidityScore")
     status: str
     updated_at: datetime = Field(alias="updatedAt")
+    quoted_at: Optional[datetime] = Field(None, alias="quotedAt")
+    quote_received_at: Optional[datetime] = Field(None, alias="quoteReceivedAt")
     
     class Config:
         populate_by_name = True
@@ -45,6 +47,14 @@ class Bond(BaseModel):
             datetime: lambda v: v.isoformat()
         }
     
+    @computed_field(alias="quoteAge")
+    @property
+    def quote_age(self) -> Optional[float]:
+        """Seconds since the upstream quote timestamp (quoted_at), not since it was received"""
+        if self.quoted_at is None:
+            return None
+        return (datetime.now(timezone.utc) - self.quoted_at).total_seconds()
+    
     @classmethod
     def from_moment_api(cls, data: Dict[str, Any]) -> "Bond":
         """Create Bond from Moment API response"""
@@ -133,6 +143,21 @@ class HistoricalPrices(BaseModel):
     prev: Optional[str]
     data: List[PricePoint]
 
+class PriceBar(BaseModel):
+    timestamp: str
+    open: float
+    high: float
+    low: float
+    close: float
+    min_yield_to_worst: Optional[float]
+    max_yield_to_worst: Optional[float]
+    count: int
+
+class PriceBars(BaseModel):
+    resolution: str
+    count: int
+    data: List[PriceBar]
+
 class OrderBookEntry(BaseModel):
     price: float
     size: int
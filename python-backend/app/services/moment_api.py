@@ -3,10 +3,49 @@ import asyncio
 import json
 import random
 import time
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from collections import deque
+from typing import Dict, List, Optional, Any, AsyncIterator, Set, Tuple
+from datetime import date, datetime, timedelta
 
-from ..models import OrderRequest, OrderResponse, Quote, HistoricalPrices, OrderBook
+from ..models import OrderRequest, OrderResponse, Quote, HistoricalPrices, OrderBook, PricePoint, PriceBar, PriceBars
+from .price_bars import PriceBarAggregator, to_epoch
+
+
+# Days of data requested per upstream call, by frequency
+PRICE_WINDOW_DAYS = {
+    "1min": 7,
+    "15min": 60,
+    "1day": 3650,
+}
+MAX_CONCURRENT_PRICE_WINDOWS = 4
+PRICE_REQUEST_TIMEOUT = 30.0
+
+
+def split_price_windows(start_date: str, end_date: str, frequency: str) -> List[Tuple[str, str]]:
+    """
+    Split a YYYY-MM-DD range into contiguous windows.
+    Window k ends on the same date window k+1 starts, so no data is lost
+    whether upstream treats `end` as inclusive, exclusive or midnight; the
+    overlapping boundary points are dropped by iter_historical_prices.
+    """
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except ValueError:
+        # Timestamps or other formats are passed through as a single window
+        return [(start_date, end_date)]
+    
+    step = timedelta(days=PRICE_WINDOW_DAYS.get(frequency, 7))
+    if start >= end:
+        return [(start_date, end_date)]
+    
+    windows = []
+    while start < end:
+        window_end = min(start + step, end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end
+    
+    return windows
 
 
 class MomentAPIService:
@@ -85,30 +124,89 @@ class MomentAPIService:
         except Exception as e:
             raise Exception(f"Failed to get quote: {str(e)}")
     
+    async def _fetch_price_window(self, client: httpx.AsyncClient, instrument_id: str, start_date: str, end_date: str, frequency: str) -> List[PricePoint]:
+        """Fetch one time window of prices, following every `next` page"""
+        url: Optional[str] = f"{self.base_url}/v1/data/instrument/{instrument_id}/price/"
+        params: Optional[Dict[str, str]] = {
+            "start": start_date,
+            "end": end_date,
+            "frequency": frequency
+        }
+        points: List[PricePoint] = []
+        
+        while url:
+            response = await client.get(url, headers=self.headers, params=params)
+            
+            if response.status_code != 200:
+                error_detail = response.text
+                raise Exception(f"Historical data API Error ({response.status_code}): {error_detail}")
+            
+            page = HistoricalPrices(**response.json())
+            points.extend(page.data)
+            
+            # `next` already carries the query string
+            params = None
+            url = page.next
+            if url and not url.startswith("http"):
+                url = f"{self.base_url}{url}"
+        
+        return points
+    
+    async def iter_historical_prices(self, instrument_id: str, start_date: str, end_date: str, frequency: str = "1day") -> AsyncIterator[List[PricePoint]]:
+        """
+        Fetch the range as concurrent time windows and yield each window's
+        points in chronological order as soon as it is available.
+        At most MAX_CONCURRENT_PRICE_WINDOWS windows are fetched ahead of the
+        consumer; points repeated on a shared window boundary are dropped.
+        """
+        windows = deque(split_price_windows(start_date, end_date, frequency))
+        tasks: deque = deque()
+        previous: Set[int] = set()
+        
+        async with httpx.AsyncClient(timeout=PRICE_REQUEST_TIMEOUT) as client:
+            def schedule() -> None:
+                while windows and len(tasks) < MAX_CONCURRENT_PRICE_WINDOWS:
+                    start, end = windows.popleft()
+                    tasks.append(asyncio.create_task(self._fetch_price_window(client, instrument_id, start, end, frequency)))
+            
+            try:
+                schedule()
+                while tasks:
+                    points = await tasks.popleft()
+                    schedule()
+                    
+                    epochs = [to_epoch(p.timestamp) for p in points]
+                    yield [p for p, epoch in zip(points, epochs) if epoch not in previous]
+                    previous = set(epochs)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
     async def get_historical_prices(self, instrument_id: str, start_date: str, end_date: str, frequency: str = "1day") -> HistoricalPrices:
         """Get historical pricing data for an instrument"""
         try:
-            # Use direct HTTP request with params since _make_request doesn't handle query params
-            url = f"{self.base_url}/v1/data/instrument/{instrument_id}/price/"
-            params = {
-                "start": start_date,
-                "end": end_date,
-                "frequency": frequency
-            }
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, params=params)
-                
-                if response.status_code != 200:
-                    error_detail = response.text
-                    raise Exception(f"Historical data API Error ({response.status_code}): {error_detail}")
-                
-                data = response.json()
+            data: List[PricePoint] = []
+            async for points in self.iter_historical_prices(instrument_id, start_date, end_date, frequency):
+                data.extend(points)
             
-            return HistoricalPrices(**data)
+            return HistoricalPrices(count=len(data), next=None, prev=None, data=data)
         except Exception as e:
             raise Exception(f"Failed to get historical prices: {str(e)}")
     
+    async def get_price_bars(self, instrument_id: str, start_date: str, end_date: str, frequency: str = "1min", resolution: str = "1h") -> PriceBars:
+        """Get historical prices downsampled to OHLC bars at the given resolution"""
+        aggregator = PriceBarAggregator(resolution)
+        try:
+            bars: List[PriceBar] = []
+            async for points in self.iter_historical_prices(instrument_id, start_date, end_date, frequency):
+                bars.extend(aggregator.add(points))
+            bars.extend(aggregator.flush())
+            
+            return PriceBars(resolution=resolution, count=len(bars), data=bars)
+        except Exception as e:
+            raise Exception(f"Failed to get price bars: {str(e)}")
+    
     async def get_order_book(self, instrument_id: str) -> OrderBook:
         """Get full order book for an instrument"""
         try:
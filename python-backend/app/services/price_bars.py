@@ -0,0 +1,135 @@
+import math
+import re
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import numpy as np
+
+from ..models import PricePoint, PriceBar
+
+
+# Largest response the price endpoints will build
+MAX_PRICE_BARS = 10000
+MAX_PRICE_POINTS = 50000
+
+RESOLUTION_UNITS = {
+    "min": 60,
+    "h": 3600,
+    "hour": 3600,
+    "day": 86400,
+    "d": 86400,
+}
+
+
+def parse_resolution(resolution: str) -> int:
+    """Convert a resolution such as '15min', '1h' or '1day' to seconds"""
+    match = re.fullmatch(r"\s*(\d+)\s*([a-z]+)\s*", resolution.lower())
+    if not match or match.group(2) not in RESOLUTION_UNITS or int(match.group(1)) <= 0:
+        raise ValueError(f"Unsupported resolution: {resolution}")
+    return int(match.group(1)) * RESOLUTION_UNITS[match.group(2)]
+
+
+def estimate_bar_count(start_date: str, end_date: str, resolution: str) -> int:
+    """Upper bound on the number of bars a start-end range yields at a resolution"""
+    start, end = to_epoch(start_date), to_epoch(end_date)
+    # A bare end date covers that whole day
+    if len(end_date) == 10:
+        end += 86400
+    span = max(end - start, 0)
+    return math.ceil(span / parse_resolution(resolution))
+
+
+def to_epoch(timestamp: str) -> int:
+    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+class PriceBarAggregator:
+    """
+    Streaming OHLC downsampler for time-ordered price points.
+    Points are fed in chunks (e.g. one page at a time); completed bars are
+    returned as soon as a later bucket starts, and the trailing partial bar is
+    carried over until more data arrives or flush() is called.
+    """
+
+    def __init__(self, resolution: str):
+        self.resolution = resolution
+        self.seconds = parse_resolution(resolution)
+        self._ts = np.empty(0, dtype=np.int64)
+        self._price = np.empty(0, dtype=np.float64)
+        self._ytw = np.empty(0, dtype=np.float64)
+
+    def add(self, points: List[PricePoint]) -> List[PriceBar]:
+        """Feed a chunk of points and return the bars it completes"""
+        if not points:
+            return []
+
+        ts = np.fromiter((to_epoch(p.timestamp) for p in points), dtype=np.int64, count=len(points))
+        price = np.fromiter((p.price for p in points), dtype=np.float64, count=len(points))
+        ytw = np.fromiter(
+            (np.nan if p.yield_to_worst is None else p.yield_to_worst for p in points),
+            dtype=np.float64,
+            count=len(points),
+        )
+
+        ts = np.concatenate((self._ts, ts))
+        price = np.concatenate((self._price, price))
+        ytw = np.concatenate((self._ytw, ytw))
+
+        if np.any(ts[1:] < ts[:-1]):
+            order = np.argsort(ts, kind="stable")
+            ts, price, ytw = ts[order], price[order], ytw[order]
+
+        buckets = ts // self.seconds
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+
+        # Keep the last bucket open: its remaining points may be in the next chunk
+        last = starts[-1]
+        self._ts, self._price, self._ytw = ts[last:], price[last:], ytw[last:]
+
+        return self._build_bars(ts[:last], price[:last], ytw[:last], starts[:-1])
+
+    def flush(self) -> List[PriceBar]:
+        """Emit the trailing partial bar"""
+        if self._ts.size == 0:
+            return []
+        bars = self._build_bars(self._ts, self._price, self._ytw, np.array([0]))
+        self._ts = self._ts[:0]
+        self._price = self._price[:0]
+        self._ytw = self._ytw[:0]
+        return bars
+
+    def _build_bars(self, ts: np.ndarray, price: np.ndarray, ytw: np.ndarray, starts: np.ndarray) -> List[PriceBar]:
+        if starts.size == 0:
+            return []
+
+        ends = np.r_[starts[1:], ts.size]
+        opens = price[starts]
+        closes = price[ends - 1]
+        highs = np.maximum.reduceat(price, starts)
+        lows = np.minimum.reduceat(price, starts)
+        # fmin/fmax ignore NaN, so missing yields only yield None when a whole bar lacks them
+        min_ytw = np.fmin.reduceat(ytw, starts)
+        max_ytw = np.fmax.reduceat(ytw, starts)
+        counts = ends - starts
+        bar_starts = ts[starts] // self.seconds * self.seconds
+
+        return [
+            PriceBar(
+                timestamp=datetime.fromtimestamp(int(bar_starts[i]), tz=timezone.utc).isoformat(),
+                open=float(opens[i]),
+                high=float(highs[i]),
+                low=float(lows[i]),
+                close=float(closes[i]),
+                min_yield_to_worst=_optional(min_ytw[i]),
+                max_yield_to_worst=_optional(max_ytw[i]),
+                count=int(counts[i]),
+            )
+            for i in range(starts.size)
+        ]
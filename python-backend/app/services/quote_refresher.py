@@ -0,0 +1,111 @@
+import asyncio
+import math
+import random
+import time
+from typing import Dict, Optional, Set
+
+from ..storage import BondStorage
+from .moment_api import MomentAPIService
+
+
+# Keeps every jittered interval strictly positive so the budget holds
+MAX_JITTER = 0.9
+
+
+class QuoteRefresher:
+    """
+    Background task that keeps stored bond quotes warm.
+    Spends a fixed upstream budget of quote requests per second, always on the
+    bond whose refresh is most overdue. Overdue-ness grows with time since the
+    last attempt, scaled by recent request interest and quoted liquidity, so
+    popular and liquid bonds are refreshed more often while every bond is
+    eventually revisited. Each tick is jittered to avoid synchronized bursts.
+    """
+
+    def __init__(
+        self,
+        moment_api: MomentAPIService,
+        storage: BondStorage,
+        requests_per_second: float = 2.0,
+        jitter: float = 0.5,
+        max_in_flight: int = 4,
+    ):
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        self.moment_api = moment_api
+        self.storage = storage
+        self.requests_per_second = requests_per_second
+        self.jitter = min(max(jitter, 0.0), MAX_JITTER)
+        self.max_in_flight = max_in_flight
+        self.last_attempt: Dict[str, float] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self._in_flight_ids: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop"""
+        if self.requests_per_second > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop and any in-flight quote requests"""
+        tasks = list(self._in_flight)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def priority(self, bond_id: str, now: float) -> float:
+        """Refresh urgency of a bond; never-attempted bonds come first"""
+        if bond_id not in self.last_attempt:
+            return math.inf
+        age = now - self.last_attempt[bond_id]
+        return age * (1 + self.storage.get_interest(bond_id, now)) * (1 + self._liquidity(bond_id))
+
+    def next_bond_id(self) -> Optional[str]:
+        """Pick the most overdue bond that is not already being refreshed"""
+        now = time.monotonic()
+        candidates = [bond_id for bond_id in self.storage.bonds if bond_id not in self._in_flight_ids]
+        if not candidates:
+            return None
+        # Break ties (e.g. several never-refreshed bonds) by interest
+        return max(candidates, key=lambda bond_id: (self.priority(bond_id, now), self.storage.get_interest(bond_id, now)))
+
+    def _liquidity(self, bond_id: str) -> float:
+        quote = self.storage.get_quote(bond_id)
+        if not quote:
+            return 0.0
+        return math.log1p((quote.bid_size or 0) + (quote.ask_size or 0))
+
+    def _interval(self) -> float:
+        base = 1.0 / self.requests_per_second
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval())
+
+            if len(self._in_flight) >= self.max_in_flight:
+                continue
+
+            bond_id = self.next_bond_id()
+            if bond_id is None:
+                continue
+
+            self.last_attempt[bond_id] = time.monotonic()
+            self._in_flight_ids.add(bond_id)
+            task = asyncio.create_task(self._refresh(bond_id))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _refresh(self, bond_id: str) -> None:
+        try:
+            quote = await self.moment_api.get_quote(bond_id)
+            self.storage.update_quote(bond_id, quote)
+        except Exception:
+            # Keep serving the previous quote; quote_age shows how stale it is
+            pass
+        finally:
+            self._in_flight_ids.discard(bond_id)
@@ -1,6 +1,17 @@
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from .models import Bond, Order
+import time
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timedelta, timezone
+from .models import Bond, Order, Quote
+
+# Request interest halves every 5 minutes without new requests
+INTEREST_HALF_LIFE_SECONDS = 300.0
+
+SORT_KEYS = {
+    'price': lambda b: b.last_price,
+    'yield': lambda b: b.ytm if b.ytm is not None else b.coupon,
+    'maturity': lambda b: b.maturity_date,
+    'quote_age': lambda b: b.quote_age,
+}
 
 class BondStorage:
     """In-memory storage for bonds and orders - perfect for demo purposes"""
@@ -8,6 +19,8 @@ class BondStorage:
     def __init__(self):
         self.bonds: Dict[str, Bond] = {}
         self.orders: Dict[str, Order] = {}
+        self.quotes: Dict[str, Quote] = {}
+        self.interest: Dict[str, Tuple[float, float]] = {}
     
     # Bond methods
     def add_bond(self, bond: Bond) -> None:
@@ -29,6 +42,45 @@ class BondStorage:
         """Get all bonds"""
         return list(self.bonds.values())
     
+    # Quote methods
+    def update_quote(self, bond_id: str, quote: Quote) -> Optional[Bond]:
+        """Store a quote and copy mid price/yields onto the bond"""
+        bond = self.bonds.get(bond_id)
+        if not bond:
+            return None
+        
+        self.quotes[bond_id] = quote
+        price = _mid(quote.bid_price, quote.ask_price)
+        ytm = _mid(quote.bid_yield_to_maturity, quote.ask_yield_to_maturity)
+        ytw = _mid(quote.bid_yield_to_worst, quote.ask_yield_to_worst)
+        bond.last_price = str(price) if price is not None else bond.last_price
+        bond.ytm = str(ytm) if ytm is not None else bond.ytm
+        bond.ytw = str(ytw) if ytw is not None else bond.ytw
+        bond.quote_received_at = datetime.now(timezone.utc)
+        bond.quoted_at = _quote_time(quote.timestamp, bond.quote_received_at)
+        return bond
+    
+    def get_quote(self, bond_id: str) -> Optional[Quote]:
+        """Get the last stored quote for a bond"""
+        return self.quotes.get(bond_id)
+    
+    # Interest methods
+    def record_interest(self, bond_id: str, weight: float = 1.0) -> None:
+        """Record a request for a bond, decaying earlier interest"""
+        # Unknown ids would otherwise grow the table without bound
+        if bond_id not in self.bonds:
+            return
+        now = time.monotonic()
+        self.interest[bond_id] = (self.get_interest(bond_id, now) + weight, now)
+    
+    def get_interest(self, bond_id: str, now: Optional[float] = None) -> float:
+        """Get the exponentially decayed request interest for a bond"""
+        if bond_id not in self.interest:
+            return 0.0
+        score, recorded_at = self.interest[bond_id]
+        now = time.monotonic() if now is None else now
+        return score * 0.5 ** ((now - recorded_at) / INTEREST_HALF_LIFE_SECONDS)
+    
     def search_bonds(self, filters: Dict[str, Any]) -> List[Bond]:
         """Search bonds with filters"""
         bonds = list(self.bonds.values())
@@ -46,12 +98,23 @@ class BondStorage:
         if 'currency' in filters:
             bonds = [b for b in bonds if b.currency == filters['currency']]
         
-        # Yield filtering (use coupon as proxy since ytm is null)
+        # Bound staleness of the refreshed price fields
+        if 'max_quote_age' in filters:
+            bonds = [b for b in bonds if b.quote_age is not None and b.quote_age <= filters['max_quote_age']]
+        
+        # Yield filtering (fall back to coupon until a quote has been stored)
         if 'min_yield' in filters:
-            bonds = [b for b in bonds if b.coupon and float(b.coupon) >= filters['min_yield']]
+            bonds = [b for b in bonds if _yield(b) is not None and _yield(b) >= filters['min_yield']]
         
         if 'max_yield' in filters:
-            bonds = [b for b in bonds if b.coupon and float(b.coupon) <= filters['max_yield']]
+            bonds = [b for b in bonds if _yield(b) is not None and _yield(b) <= filters['max_yield']]
+        
+        # Price filtering
+        if 'min_price' in filters:
+            bonds = [b for b in bonds if b.last_price and float(b.last_price) >= filters['min_price']]
+        
+        if 'max_price' in filters:
+            bonds = [b for b in bonds if b.last_price and float(b.last_price) <= filters['max_price']]
         
         # Maturity filtering
         if 'min_maturity' in filters:
@@ -62,6 +125,16 @@ class BondStorage:
             max_date = datetime.now() + timedelta(days=365 * filters['max_maturity'])
             bonds = [b for b in bonds if b.maturity_date and b.maturity_date <= max_date]
         
+        # Sorting (bonds without a value always go last)
+        if 'sort_by' in filters:
+            key = SORT_KEYS[filters['sort_by']]
+            descending = filters.get('descending', False)
+            present = [b for b in bonds if key(b) is not None]
+            missing = [b for b in bonds if key(b) is None]
+            numeric = filters['sort_by'] != 'maturity'
+            present.sort(key=lambda b: float(key(b)) if numeric else key(b), reverse=descending)
+            bonds = present + missing
+        
         return bonds
     
     # Order methods
@@ -129,4 +202,29 @@ class BondStorage:
         for bond in self.bonds.values():
             if bond.bond_type:
                 bond_types.add(bond.bond_type)
-        return sorted(list(bond_types))
\ No newline at end of file
+        return sorted(list(bond_types))
+
+
+def _mid(bid: Optional[float], ask: Optional[float]) -> Optional[float]:
+    """Mid of bid/ask, or whichever side is present"""
+    if bid is not None and ask is not None:
+        return (bid + ask) / 2
+    return bid if bid is not None else ask
+
+
+def _quote_time(timestamp: str, received_at: datetime) -> datetime:
+    """Upstream quote time in UTC, or the receive time if it does not parse"""
+    try:
+        quoted_at = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return received_at
+    # Naive timestamps are local, like the fallback in MomentAPIService.get_quote
+    quoted_at = quoted_at.astimezone(timezone.utc)
+    # Clock skew must not make a quote look newer than when it arrived
+    return min(quoted_at, received_at)
+
+
+def _yield(bond: Bond) -> Optional[float]:
+    """Quoted yield to maturity, or coupon as a proxy when not yet quoted"""
+    value = bond.ytm if bond.ytm is not None else bond.coupon
+    return float(value) if value else None
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Make the `app` package importable, as run.py does
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
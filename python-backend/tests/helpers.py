@@ -0,0 +1,32 @@
+from typing import Optional
+
+from app.models import Bond, Quote
+
+
+def make_bond(isin: str, coupon: Optional[float] = 5.0, maturity: str = "2030-01-01T00:00:00Z") -> Bond:
+    return Bond.from_moment_api({
+        "isin": isin,
+        "issuer": "Issuer",
+        "description": f"Bond {isin}",
+        "type": "corporate",
+        "coupon": coupon,
+        "maturity_date": maturity,
+        "par_value": 1000,
+        "status": "outstanding",
+    })
+
+
+def make_quote(bid: Optional[float] = 99.0, ask: Optional[float] = 101.0, timestamp: str = "", size: Optional[int] = None) -> Quote:
+    return Quote(
+        timestamp=timestamp,
+        bid_price=bid,
+        bid_yield_to_maturity=4.0 if bid is not None else None,
+        bid_yield_to_worst=None,
+        bid_size=size,
+        bid_min_size=None,
+        ask_price=ask,
+        ask_yield_to_maturity=4.2 if ask is not None else None,
+        ask_yield_to_worst=None,
+        ask_size=size,
+        ask_min_size=None,
+    )
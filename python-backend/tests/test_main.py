@@ -0,0 +1,24 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+# No context manager: skip the lifespan so nothing talks to upstream
+client = TestClient(app)
+
+
+def test_price_bars_rejects_too_many_bars():
+    response = client.get("/api/bonds/X/prices/bars", params={"start": "2024-01-01", "end": "2024-12-31", "resolution": "1min"})
+    assert response.status_code == 400
+    assert "max 10000" in response.json()["detail"]
+
+
+def test_price_bars_rejects_invalid_resolution():
+    response = client.get("/api/bonds/X/prices/bars", params={"start": "2024-01-01", "end": "2024-01-02", "resolution": "1week"})
+    assert response.status_code == 400
+
+
+def test_prices_rejects_long_minute_range():
+    response = client.get("/api/bonds/X/prices", params={"start": "2024-01-01", "end": "2024-12-31", "frequency": "1min"})
+    assert response.status_code == 400
+    assert "/prices/bars" in response.json()["detail"]
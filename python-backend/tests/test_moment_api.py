@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from app.services import moment_api
+from app.services.moment_api import MomentAPIService, split_price_windows
+
+
+def test_split_price_windows_are_contiguous():
+    windows = split_price_windows("2024-01-01", "2024-01-20", "1min")
+    assert windows == [
+        ("2024-01-01", "2024-01-08"),
+        ("2024-01-08", "2024-01-15"),
+        ("2024-01-15", "2024-01-20"),
+    ]
+
+
+def test_split_price_windows_single_window():
+    assert split_price_windows("2024-01-01", "2024-01-01", "1min") == [("2024-01-01", "2024-01-01")]
+    assert split_price_windows("2024-01-01", "2024-12-31", "1day") == [("2024-01-01", "2024-12-31")]
+    assert split_price_windows("2024-01-01T09:00:00", "2024-01-02", "1min") == [("2024-01-01T09:00:00", "2024-01-02")]
+
+
+def point(dt):
+    return {"timestamp": dt.isoformat() + "Z", "price": 100.0, "yield_to_worst": None, "yield_to_maturity": None}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Fake price endpoint: two pages per window, each window returning points
+    at both its start and end date (as an inclusive upstream would).
+    """
+    state = {"in_flight": 0, "max_in_flight": 0, "requests": []}
+
+    async def handler(request):
+        state["requests"].append(request.url)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+
+        params = request.url.params
+        if "page" in params:
+            end = datetime.fromisoformat(params["end"])
+            return httpx.Response(200, json={"count": 1, "next": None, "prev": None, "data": [point(end)]})
+
+        start = datetime.fromisoformat(params["start"])
+        next_page = f"/v1/data/instrument/X/price/?page=2&end={params['end']}"
+        data = [point(start), point(start + timedelta(hours=12))]
+        return httpx.Response(200, json={"count": 2, "next": next_page, "prev": None, "data": data})
+
+    client = httpx.AsyncClient
+    monkeypatch.setattr(
+        moment_api.httpx, "AsyncClient",
+        lambda **kwargs: client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+    return state
+
+
+def test_historical_prices_follow_pages_and_drop_boundary_duplicates(upstream):
+    prices = asyncio.run(MomentAPIService().get_historical_prices("X", "2024-01-01", "2024-01-20", "1min"))
+
+    timestamps = [p.timestamp for p in prices.data]
+    assert timestamps == sorted(set(timestamps))
+    assert timestamps[0] == "2024-01-01T00:00:00Z"
+    assert timestamps[-1] == "2024-01-20T00:00:00Z"
+    assert "2024-01-08T00:00:00Z" in timestamps
+    assert prices.count == len(timestamps) == 7
+    assert prices.next is None
+    # Two pages for each of the three windows
+    assert len(upstream["requests"]) == 6
+
+
+def test_fetch_stays_bounded_ahead_of_consumer(upstream, monkeypatch):
+    monkeypatch.setattr(moment_api, "MAX_CONCURRENT_PRICE_WINDOWS", 2)
+
+    async def consume():
+        service = MomentAPIService()
+        windows = 0
+        async for _ in service.iter_historical_prices("X", "2024-01-01", "2024-03-01", "1min"):
+            windows += 1
+            # A slow consumer must not let fetches run ahead of it
+            await asyncio.sleep(0.05)
+            assert len(upstream["requests"]) <= 2 * (windows + 2)
+        return windows
+
+    assert asyncio.run(consume()) == 9
+    assert upstream["max_in_flight"] <= 2
+
+
+def test_price_bars(upstream):
+    bars = asyncio.run(MomentAPIService().get_price_bars("X", "2024-01-01", "2024-01-20", "1min", "1day"))
+
+    assert bars.resolution == "1day"
+    assert bars.count == len(bars.data)
+    assert sum(b.count for b in bars.data) == 7
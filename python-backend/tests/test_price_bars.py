@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models import PricePoint
+from app.services.price_bars import PriceBarAggregator, estimate_bar_count, parse_resolution
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_points(minutes, price=None, ytw=None):
+    return [
+        PricePoint(
+            timestamp=(START + timedelta(minutes=m)).isoformat().replace("+00:00", "Z"),
+            price=float(m) if price is None else price(m),
+            yield_to_worst=float(m) if ytw is None else ytw(m),
+            yield_to_maturity=None,
+        )
+        for m in minutes
+    ]
+
+
+def test_parse_resolution():
+    assert parse_resolution("1min") == 60
+    assert parse_resolution("15min") == 900
+    assert parse_resolution("1h") == 3600
+    assert parse_resolution("4hour") == 4 * 3600
+    assert parse_resolution("1day") == 86400
+
+
+@pytest.mark.parametrize("resolution", ["", "h", "0h", "1week", "-1h", "1.5h"])
+def test_parse_resolution_rejects_invalid(resolution):
+    with pytest.raises(ValueError):
+        parse_resolution(resolution)
+
+
+def test_estimate_bar_count_covers_whole_end_day():
+    assert estimate_bar_count("2024-01-01", "2024-01-01", "1h") == 24
+    assert estimate_bar_count("2024-01-01", "2024-12-31", "1h") == 366 * 24
+    assert estimate_bar_count("2024-01-01T00:00:00Z", "2024-01-01T01:30:00", "1h") == 2
+    assert estimate_bar_count("2024-01-02", "2024-01-01", "1h") == 0
+
+
+def test_single_chunk_ohlc():
+    agg = PriceBarAggregator("15min")
+    bars = agg.add(make_points(range(30))) + agg.flush()
+
+    assert [b.timestamp for b in bars] == ["2024-01-01T00:00:00+00:00", "2024-01-01T00:15:00+00:00"]
+    first = bars[0]
+    assert (first.open, first.high, first.low, first.close, first.count) == (0.0, 14.0, 0.0, 14.0, 15)
+    assert (first.min_yield_to_worst, first.max_yield_to_worst) == (0.0, 14.0)
+
+
+def test_partial_bar_carries_across_chunks():
+    points = make_points(range(40))
+    agg = PriceBarAggregator("15min")
+
+    assert agg.add(points[:10]) == []
+    completed = agg.add(points[10:25])
+    assert [b.count for b in completed] == [15]
+    completed += agg.add(points[25:])
+    completed += agg.flush()
+
+    whole = PriceBarAggregator("15min")
+    expected = whole.add(points) + whole.flush()
+    assert completed == expected
+    assert [b.count for b in completed] == [15, 15, 10]
+    assert agg.flush() == []
+
+
+def test_out_of_order_input_is_sorted():
+    points = make_points(range(20))
+    agg = PriceBarAggregator("15min")
+    bars = agg.add(list(reversed(points))) + agg.flush()
+
+    assert (bars[0].open, bars[0].close) == (0.0, 14.0)
+    assert (bars[1].open, bars[1].close) == (15.0, 19.0)
+
+
+def test_missing_yields():
+    agg = PriceBarAggregator("15min")
+    points = make_points(range(30), ytw=lambda m: None if m < 15 or m % 2 else float(m))
+    bars = agg.add(points) + agg.flush()
+
+    assert (bars[0].min_yield_to_worst, bars[0].max_yield_to_worst) == (None, None)
+    assert (bars[1].min_yield_to_worst, bars[1].max_yield_to_worst) == (16.0, 28.0)
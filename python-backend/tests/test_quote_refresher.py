@@ -0,0 +1,171 @@
+import asyncio
+import math
+import time
+
+import pytest
+
+from app.services import quote_refresher as quote_refresher_module
+from app.services.quote_refresher import MAX_JITTER, QuoteRefresher
+from app.storage import BondStorage
+from helpers import make_bond, make_quote
+
+
+# Patching the refresher's sleep patches asyncio globally; tests yield with this
+real_sleep = asyncio.sleep
+
+class StubMomentAPI:
+    """Quote source that blocks until released and records every request"""
+
+    def __init__(self, block: bool = False, fail: bool = False):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.block = block
+        self.fail = fail
+
+    async def get_quote(self, bond_id):
+        self.calls.append(bond_id)
+        if self.block:
+            await self.release.wait()
+        if self.fail:
+            raise Exception("upstream down")
+        return make_quote()
+
+
+@pytest.fixture
+def storage():
+    storage = BondStorage()
+    for i in range(4):
+        storage.add_bond(make_bond(f"US{i:010d}"))
+    return storage
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    """Replace the refresher's sleep with a zero-delay one that records each interval"""
+    intervals = []
+
+    async def sleep(delay, *args, **kwargs):
+        intervals.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(quote_refresher_module.asyncio, "sleep", sleep)
+    return intervals
+
+
+def test_never_attempted_bonds_first_ordered_by_interest(storage):
+    refresher = QuoteRefresher(StubMomentAPI(), storage)
+    storage.record_interest("US0000000002")
+
+    assert refresher.priority("US0000000002", time.monotonic()) == math.inf
+    assert refresher.next_bond_id() == "US0000000002"
+
+
+def test_priority_scales_with_interest_and_liquidity(storage):
+    refresher = QuoteRefresher(StubMomentAPI(), storage)
+    now = time.monotonic()
+    for bond_id in storage.bonds:
+        refresher.last_attempt[bond_id] = now - 10
+
+    storage.record_interest("US0000000001")
+    storage.update_quote("US0000000002", make_quote(size=1000))
+
+    base = refresher.priority("US0000000000", now)
+    assert base == pytest.approx(10)
+    assert refresher.priority("US0000000001", now) > base
+    assert refresher.priority("US0000000002", now) == pytest.approx(10 * (1 + math.log1p(2000)))
+    assert refresher.next_bond_id() == "US0000000002"
+
+    # Staleness eventually outweighs interest and liquidity
+    refresher.last_attempt["US0000000000"] = now - 10_000
+    assert refresher.next_bond_id() == "US0000000000"
+
+
+def test_next_bond_skips_in_flight(storage):
+    refresher = QuoteRefresher(StubMomentAPI(), storage)
+    refresher._in_flight_ids.update(["US0000000000", "US0000000001", "US0000000002"])
+
+    assert refresher.next_bond_id() == "US0000000003"
+    refresher._in_flight_ids.add("US0000000003")
+    assert refresher.next_bond_id() is None
+
+
+@pytest.mark.parametrize("jitter, expected", [(-1.0, 0.0), (0.3, 0.3), (1.0, MAX_JITTER), (5.0, MAX_JITTER)])
+def test_jitter_is_clamped(storage, jitter, expected):
+    refresher = QuoteRefresher(StubMomentAPI(), storage, requests_per_second=10, jitter=jitter)
+
+    assert refresher.jitter == expected
+    for _ in range(200):
+        assert 0.1 * (1 - expected) <= refresher._interval() <= 0.1 * (1 + expected)
+
+
+def test_max_in_flight_must_be_positive(storage):
+    with pytest.raises(ValueError):
+        QuoteRefresher(StubMomentAPI(), storage, max_in_flight=0)
+
+
+def test_disabled_when_budget_is_zero(storage):
+    async def run():
+        refresher = QuoteRefresher(StubMomentAPI(), storage, requests_per_second=0)
+        refresher.start()
+        assert refresher._task is None
+        await refresher.stop()
+
+    asyncio.run(run())
+
+
+def test_refreshes_every_bond_within_budget(storage, fast_sleep):
+    async def run():
+        api = StubMomentAPI()
+        refresher = QuoteRefresher(api, storage, requests_per_second=5, jitter=5.0)
+        refresher.start()
+        while len(api.calls) < 8:
+            await real_sleep(0)
+        await refresher.stop()
+        return api
+
+    api = asyncio.run(run())
+
+    # Each bond once before any is repeated
+    assert sorted(api.calls[:4]) == sorted(storage.bonds)
+    assert all(bond.quoted_at is not None for bond in storage.get_all_bonds())
+    # One request per interval, and no interval shorter than the clamped jitter allows
+    assert len(api.calls) <= len(fast_sleep)
+    assert min(fast_sleep) >= (1 - MAX_JITTER) / 5
+
+
+def test_in_flight_cap_and_stop_cancels(storage, fast_sleep):
+    async def run():
+        api = StubMomentAPI(block=True)
+        refresher = QuoteRefresher(api, storage, requests_per_second=5, max_in_flight=2)
+        refresher.start()
+        for _ in range(50):
+            await real_sleep(0)
+
+        assert len(api.calls) == 2
+        assert len(set(api.calls)) == 2
+        in_flight = list(refresher._in_flight)
+
+        await refresher.stop()
+        assert refresher._task is None
+        assert all(task.cancelled() for task in in_flight)
+        assert refresher._in_flight == set()
+        assert refresher._in_flight_ids == set()
+
+    asyncio.run(run())
+
+
+def test_failed_refresh_keeps_previous_quote(storage, fast_sleep):
+    storage.update_quote("US0000000000", make_quote(109.0, 111.0))
+
+    async def run():
+        api = StubMomentAPI(fail=True)
+        refresher = QuoteRefresher(api, storage, requests_per_second=5)
+        refresher.start()
+        while len(api.calls) < 4:
+            await real_sleep(0)
+        await refresher.stop()
+
+    asyncio.run(run())
+
+    assert storage.get_bond("US0000000000").last_price == "110.0"
+    assert storage.get_bond("US0000000001").last_price is None
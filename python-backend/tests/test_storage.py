@@ -0,0 +1,118 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.storage import BondStorage, INTEREST_HALF_LIFE_SECONDS
+from helpers import make_bond, make_quote
+
+
+@pytest.fixture
+def storage():
+    storage = BondStorage()
+    for i in range(4):
+        storage.add_bond(make_bond(f"US{i:010d}", coupon=float(i)))
+    return storage
+
+
+def test_update_quote_copies_mid_price_and_yields(storage):
+    bond = storage.update_quote("US0000000001", make_quote(99.0, 101.0))
+
+    assert bond.last_price == "100.0"
+    assert float(bond.ytm) == pytest.approx(4.1)
+    assert bond.ytw is None
+    assert storage.get_quote("US0000000001").bid_price == 99.0
+
+
+def test_update_quote_one_sided(storage):
+    bond = storage.update_quote("US0000000001", make_quote(bid=None, ask=101.0))
+    assert bond.last_price == "101.0"
+
+
+def test_update_quote_unknown_bond(storage):
+    assert storage.update_quote("missing", make_quote()) is None
+    assert storage.get_quote("missing") is None
+
+
+def test_quote_age_uses_upstream_timestamp(storage):
+    quoted = datetime.now(timezone.utc) - timedelta(hours=2)
+    bond = storage.update_quote("US0000000001", make_quote(timestamp=quoted.isoformat().replace("+00:00", "Z")))
+
+    assert bond.quoted_at == quoted
+    assert bond.quote_age == pytest.approx(7200, abs=5)
+    assert bond.quote_received_at > quoted
+
+    serialized = bond.model_dump(by_alias=True)
+    assert serialized["quoteAge"] == pytest.approx(7200, abs=5)
+
+
+def test_quote_age_falls_back_to_receive_time(storage):
+    bond = storage.update_quote("US0000000001", make_quote(timestamp="not a timestamp"))
+    assert bond.quoted_at == bond.quote_received_at
+    assert bond.quote_age < 5
+
+
+def test_quote_from_the_future_is_capped_at_receive_time(storage):
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    bond = storage.update_quote("US0000000001", make_quote(timestamp=future.isoformat()))
+    assert bond.quoted_at == bond.quote_received_at
+
+
+def test_record_interest_ignores_unknown_bonds(storage):
+    storage.record_interest("made-up")
+    assert storage.interest == {}
+    assert storage.get_interest("made-up") == 0.0
+
+
+def test_interest_decays(storage):
+    storage.record_interest("US0000000001")
+    storage.record_interest("US0000000001")
+    now = time.monotonic()
+
+    assert storage.get_interest("US0000000001", now) == pytest.approx(2.0, rel=1e-3)
+    assert storage.get_interest("US0000000001", now + INTEREST_HALF_LIFE_SECONDS) == pytest.approx(1.0, rel=1e-3)
+
+
+def test_price_filters_skip_unquoted_bonds(storage):
+    storage.update_quote("US0000000001", make_quote(99.0, 101.0))
+    storage.update_quote("US0000000002", make_quote(109.0, 111.0))
+
+    assert [b.id for b in storage.search_bonds({'min_price': 105})] == ["US0000000002"]
+    assert [b.id for b in storage.search_bonds({'max_price': 105})] == ["US0000000001"]
+
+
+def test_yield_filter_prefers_quoted_ytm(storage):
+    # Coupon 3 but quoted ytm 4.1
+    storage.update_quote("US0000000003", make_quote())
+
+    assert [b.id for b in storage.search_bonds({'min_yield': 2.5, 'max_yield': 3.5})] == []
+    assert [b.id for b in storage.search_bonds({'min_yield': 2, 'max_yield': 2.5})] == ["US0000000002"]
+    assert "US0000000003" in [b.id for b in storage.search_bonds({'min_yield': 4})]
+
+
+def test_max_quote_age(storage):
+    stale = datetime.now(timezone.utc) - timedelta(minutes=10)
+    storage.update_quote("US0000000001", make_quote(timestamp=stale.isoformat()))
+    storage.update_quote("US0000000002", make_quote())
+
+    assert [b.id for b in storage.search_bonds({'max_quote_age': 60})] == ["US0000000002"]
+
+
+def test_sort_by_price_puts_missing_last(storage):
+    storage.update_quote("US0000000001", make_quote(109.0, 111.0))
+    storage.update_quote("US0000000002", make_quote(99.0, 101.0))
+
+    ascending = [b.id for b in storage.search_bonds({'sort_by': 'price'})]
+    descending = [b.id for b in storage.search_bonds({'sort_by': 'price', 'descending': True})]
+
+    assert ascending[:2] == ["US0000000002", "US0000000001"]
+    assert descending[:2] == ["US0000000001", "US0000000002"]
+    assert set(ascending[2:]) == set(descending[2:]) == {"US0000000000", "US0000000003"}
+
+
+def test_sort_by_yield_falls_back_to_coupon(storage):
+    storage.update_quote("US0000000000", make_quote())
+
+    assert [b.id for b in storage.search_bonds({'sort_by': 'yield'})] == [
+        "US0000000001", "US0000000002", "US0000000003", "US0000000000"
+    ]